@@ -51,6 +51,22 @@ impl bindings::HostComponent for Host {
         Err(wasmtime::Error::msg("Unexpected call to Component::set"))
     }
 
+    fn get_f32s(&mut self, _: Resource<bindings::Component>) -> Result<Vec<f32>, wasmtime::Error> {
+        Err(wasmtime::Error::msg(
+            "Unexpected call to Component::get_f32s",
+        ))
+    }
+
+    fn set_f32s(
+        &mut self,
+        _: Resource<bindings::Component>,
+        _: Vec<f32>,
+    ) -> Result<(), wasmtime::Error> {
+        Err(wasmtime::Error::msg(
+            "Unexpected call to Component::set_f32s",
+        ))
+    }
+
     fn drop(&mut self, _: Resource<bindings::Component>) -> Result<(), wasmtime::Error> {
         Err(wasmtime::Error::msg("Unexpected call to Component::drop"))
     }
@@ -94,6 +110,16 @@ impl bindings::HostCommands for Host {
             "Unexpected call to Commands::spawn_empty",
         ))
     }
+
+    fn spawn_batch(
+        &mut self,
+        _: Resource<bindings::Commands>,
+        _: Vec<bindings::Bundle>,
+    ) -> Result<(), wasmtime::Error> {
+        Err(wasmtime::Error::msg(
+            "Unexpected call to Commands::spawn_batch",
+        ))
+    }
 }
 
 impl bindings::HostEntityCommands for Host {
@@ -190,6 +216,31 @@ impl bindings::HostQuery for Host {
     ) -> Result<Option<Resource<bindings::QueryResult>>, wasmtime::Error> {
         Err(wasmtime::Error::msg("Unexpected call to Query::iter"))
     }
+
+    fn count(&mut self, _: Resource<bindings::Query>) -> Result<u32, wasmtime::Error> {
+        Err(wasmtime::Error::msg("Unexpected call to Query::count"))
+    }
+
+    fn get_column_f32s(
+        &mut self,
+        _: Resource<bindings::Query>,
+        _: bindings::ComponentIndex,
+    ) -> Result<Vec<f32>, wasmtime::Error> {
+        Err(wasmtime::Error::msg(
+            "Unexpected call to Query::get_column_f32s",
+        ))
+    }
+
+    fn set_column_f32s(
+        &mut self,
+        _: Resource<bindings::Query>,
+        _: bindings::ComponentIndex,
+        _: Vec<f32>,
+    ) -> Result<(), wasmtime::Error> {
+        Err(wasmtime::Error::msg(
+            "Unexpected call to Query::set_column_f32s",
+        ))
+    }
 }
 
 impl bindings::HostSerialize for Host {
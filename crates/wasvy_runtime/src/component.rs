@@ -5,7 +5,7 @@
 
 use std::{alloc::Layout, any::TypeId};
 
-use anyhow::{Result, anyhow};
+use anyhow::{Result, anyhow, bail};
 use bevy_derive::{Deref, DerefMut};
 use bevy_ecs::{
     component::{ComponentDescriptor, ComponentId},
@@ -14,7 +14,7 @@ use bevy_ecs::{
     world::{FilteredEntityMut, FilteredEntityRef},
 };
 use bevy_platform::collections::HashMap;
-use bevy_reflect::{Reflect, ReflectFromPtr};
+use bevy_reflect::{PartialReflect, Reflect, ReflectFromPtr, ReflectMut, ReflectRef};
 
 use crate::serialize::CodecResource;
 
@@ -301,6 +301,240 @@ pub fn set_component(
     }
 }
 
+/// Retrieves the value of a component on an entity as its raw `f32` leaves.
+///
+/// Walks the reflected value in field declaration order and collects every
+/// `f32` it contains, skipping the negotiated codec entirely. Only host types
+/// registered for reflection support this; guest components only exist in
+/// their serialized representation.
+pub fn get_component_f32s(
+    entity: &FilteredEntityRef,
+    component: &ComponentRef,
+    type_registry: &AppTypeRegistry,
+) -> Result<Vec<f32>> {
+    let mut values = Vec::new();
+    collect_component_f32s(entity, component, type_registry, &mut values)?;
+    Ok(values)
+}
+
+/// Appends the raw `f32` leaves of a component to `out`.
+///
+/// Like [get_component_f32s], but reuses the caller's buffer so columns
+/// spanning many entities can be collected without per-entity allocations.
+pub fn collect_component_f32s(
+    entity: &FilteredEntityRef,
+    component: &ComponentRef,
+    type_registry: &AppTypeRegistry,
+    out: &mut Vec<f32>,
+) -> Result<()> {
+    let val = entity
+        .get_by_id(component.component_id)
+        .expect("to be able to find this component id on the entity");
+
+    let Some(type_id) = component.type_id else {
+        bail!(
+            "Component {} is a guest component and has no raw f32 layout",
+            component.type_path
+        );
+    };
+
+    let type_registry = type_registry.read();
+    let type_registration = type_registry
+        .get(type_id)
+        .expect("ComponentRef type_id be registered");
+    let reflect_from_ptr = type_registration
+        .data::<ReflectFromPtr>()
+        .expect("ReflectFromPtr to be registered");
+
+    // SAFETY: val is of the same type that reflect_from_ptr was constructed for
+    let reflect = unsafe { reflect_from_ptr.as_reflect(val) };
+
+    collect_f32_leaves(reflect.as_partial_reflect(), out)
+}
+
+/// Sets the value of a component on an entity from its raw `f32` leaves.
+///
+/// The inverse of [get_component_f32s]: `values` must contain exactly one
+/// entry per `f32` leaf of the reflected value, in field declaration order.
+pub fn set_component_f32s(
+    entity: &mut FilteredEntityMut,
+    component_ref: &ComponentRef,
+    values: &[f32],
+    type_registry: &AppTypeRegistry,
+) -> Result<()> {
+    let mut values = values.iter();
+    apply_component_f32s(entity, component_ref, &mut values, type_registry)?;
+    if values.next().is_some() {
+        bail!(
+            "Too many f32 values for component {}",
+            component_ref.type_path
+        );
+    }
+
+    Ok(())
+}
+
+/// Writes the next `f32` leaves from `values` into a component.
+///
+/// Like [set_component_f32s], but consumes exactly as many values as the
+/// component has leaves from a shared iterator, so one column can be written
+/// back across many entities.
+///
+/// Writes that leave every leaf unchanged are skipped without marking the
+/// component as changed, so they don't trigger the host's change detection.
+pub fn apply_component_f32s<'a>(
+    entity: &mut FilteredEntityMut,
+    component_ref: &ComponentRef,
+    values: &mut impl Iterator<Item = &'a f32>,
+    type_registry: &AppTypeRegistry,
+) -> Result<()> {
+    let Some(type_id) = component_ref.type_id else {
+        bail!(
+            "Component {} is a guest component and has no raw f32 layout",
+            component_ref.type_path
+        );
+    };
+
+    let type_registry = type_registry.read();
+    let type_registration = type_registry
+        .get(type_id)
+        .expect("ComponentRef type_id be registered");
+    let reflect_from_ptr = type_registration
+        .data::<ReflectFromPtr>()
+        .expect("ReflectFromPtr to be registered");
+
+    let mut val = entity
+        .get_mut_by_id(component_ref.component_id)
+        .expect("to be able to find this component id on the entity");
+
+    // Bypass change detection while writing: each leaf is compared against
+    // its incoming value in the same pass, and the change tick is only bumped
+    // afterwards if any leaf actually differed. This keeps unchanged writes
+    // from needlessly waking every change-detection-filtered system
+    // downstream, without a separate read-back traversal.
+    let ptr = val.bypass_change_detection().reborrow();
+
+    // SAFETY: val is of the same type that ReflectFromPtr was constructed for
+    let reflect = unsafe { reflect_from_ptr.as_reflect_mut(ptr) };
+
+    let mut changed = false;
+    apply_f32_leaves(reflect.as_partial_reflect_mut(), values, &mut changed)?;
+    if changed {
+        val.set_changed();
+    }
+
+    Ok(())
+}
+
+/// Collects every `f32` leaf of a reflected value, in field declaration order.
+fn collect_f32_leaves(value: &dyn PartialReflect, out: &mut Vec<f32>) -> Result<()> {
+    if let Some(leaf) = value.try_downcast_ref::<f32>() {
+        out.push(*leaf);
+        return Ok(());
+    }
+
+    match value.reflect_ref() {
+        ReflectRef::Struct(value) => {
+            for index in 0..value.field_len() {
+                collect_f32_leaves(value.field_at(index).expect("field index in range"), out)?;
+            }
+        }
+        ReflectRef::TupleStruct(value) => {
+            for index in 0..value.field_len() {
+                collect_f32_leaves(value.field(index).expect("field index in range"), out)?;
+            }
+        }
+        ReflectRef::Tuple(value) => {
+            for index in 0..value.field_len() {
+                collect_f32_leaves(value.field(index).expect("field index in range"), out)?;
+            }
+        }
+        ReflectRef::Array(value) => {
+            for item in value.iter() {
+                collect_f32_leaves(item, out)?;
+            }
+        }
+        ReflectRef::List(value) => {
+            for item in value.iter() {
+                collect_f32_leaves(item, out)?;
+            }
+        }
+        _ => bail!(
+            "{} has a leaf that is not an f32",
+            value.reflect_type_path()
+        ),
+    }
+
+    Ok(())
+}
+
+/// Writes `values` into every `f32` leaf of a reflected value, in field
+/// declaration order.
+///
+/// Sets `changed` if any leaf received a different value than it already held.
+fn apply_f32_leaves<'a>(
+    value: &mut dyn PartialReflect,
+    values: &mut impl Iterator<Item = &'a f32>,
+    changed: &mut bool,
+) -> Result<()> {
+    if let Some(leaf) = value.try_downcast_mut::<f32>() {
+        let next = *values
+            .next()
+            .ok_or_else(|| anyhow!("Not enough f32 values for component"))?;
+        if *leaf != next {
+            *leaf = next;
+            *changed = true;
+        }
+        return Ok(());
+    }
+
+    match value.reflect_mut() {
+        ReflectMut::Struct(value) => {
+            for index in 0..value.field_len() {
+                apply_f32_leaves(
+                    value.field_at_mut(index).expect("field index in range"),
+                    values,
+                    changed,
+                )?;
+            }
+        }
+        ReflectMut::TupleStruct(value) => {
+            for index in 0..value.field_len() {
+                apply_f32_leaves(
+                    value.field_mut(index).expect("field index in range"),
+                    values,
+                    changed,
+                )?;
+            }
+        }
+        ReflectMut::Tuple(value) => {
+            for index in 0..value.field_len() {
+                apply_f32_leaves(
+                    value.field_mut(index).expect("field index in range"),
+                    values,
+                    changed,
+                )?;
+            }
+        }
+        ReflectMut::Array(value) => {
+            for item in value.iter_mut() {
+                apply_f32_leaves(item, values, changed)?;
+            }
+        }
+        ReflectMut::List(value) => {
+            for item in value.iter_mut() {
+                apply_f32_leaves(item, values, changed)?;
+            }
+        }
+        _ => bail!(
+            "{} has a leaf that is not an f32",
+            value.reflect_type_path()
+        ),
+    }
+
+    Ok(())
+}
+
 pub fn with_component_ref<R>(
     entity: &FilteredEntityRef,
     component_ref: &ComponentRef,
@@ -362,3 +596,168 @@ pub fn with_component_mut<R>(
 
     f(reflect)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use bevy_app::App;
+    use bevy_ecs::prelude::ReflectComponent;
+    use bevy_reflect::TypePath;
+
+    #[derive(Reflect, Default)]
+    struct Vec3Like {
+        x: f32,
+        y: f32,
+        z: f32,
+    }
+
+    #[derive(Reflect, Default)]
+    struct QuatLike {
+        x: f32,
+        y: f32,
+        z: f32,
+        w: f32,
+    }
+
+    /// Mirrors the leaf layout of `Transform` (10 f32s across three nested
+    /// structs) without depending on bevy_transform.
+    #[derive(Component, Reflect, Default)]
+    #[reflect(Component)]
+    struct FakeTransform {
+        translation: Vec3Like,
+        rotation: QuatLike,
+        scale: Vec3Like,
+    }
+
+    #[derive(Reflect, Default)]
+    struct NotAllF32s {
+        value: f32,
+        name: String,
+    }
+
+    fn leaves(value: &dyn PartialReflect) -> Vec<f32> {
+        let mut out = Vec::new();
+        collect_f32_leaves(value, &mut out).unwrap();
+        out
+    }
+
+    fn with_transform_entity(
+        f: impl FnOnce(&mut FilteredEntityMut, &ComponentRef, &AppTypeRegistry),
+    ) {
+        let mut app = App::new();
+        app.register_type::<FakeTransform>();
+        let world = app.world_mut();
+        world.spawn(FakeTransform::default());
+
+        let component = ComponentRef::new(FakeTransform::type_path(), world).unwrap();
+        let type_registry = world.resource::<AppTypeRegistry>().clone();
+
+        let mut query = QueryBuilder::<FilteredEntityMut>::new(world)
+            .mut_id(component.component_id())
+            .build();
+        let mut entity = query.single_mut(world).unwrap();
+
+        f(&mut entity, &component, &type_registry);
+    }
+
+    #[test]
+    fn collect_and_apply_round_trip() {
+        let mut transform = FakeTransform::default();
+        let incoming: Vec<f32> = (0..10).map(|i| i as f32).collect();
+
+        let mut values = incoming.iter();
+        let mut changed = false;
+        apply_f32_leaves(
+            transform.as_partial_reflect_mut(),
+            &mut values,
+            &mut changed,
+        )
+        .unwrap();
+
+        assert!(changed);
+        assert!(values.next().is_none());
+        assert_eq!(leaves(transform.as_partial_reflect()), incoming);
+        // Leaves come out in field declaration order.
+        assert_eq!(transform.translation.x, 0.0);
+        assert_eq!(transform.rotation.w, 6.0);
+        assert_eq!(transform.scale.z, 9.0);
+    }
+
+    #[test]
+    fn unchanged_apply_is_not_marked_changed() {
+        let mut transform = FakeTransform::default();
+        let current = leaves(transform.as_partial_reflect());
+
+        let mut changed = false;
+        apply_f32_leaves(
+            transform.as_partial_reflect_mut(),
+            &mut current.iter(),
+            &mut changed,
+        )
+        .unwrap();
+
+        assert!(!changed);
+    }
+
+    #[test]
+    fn apply_fails_when_values_run_out() {
+        let mut transform = FakeTransform::default();
+        let too_few = [1.0f32; 9];
+
+        let mut changed = false;
+        let result = apply_f32_leaves(
+            transform.as_partial_reflect_mut(),
+            &mut too_few.iter(),
+            &mut changed,
+        );
+
+        assert!(result.is_err());
+    }
+
+    #[test]
+    fn non_f32_leaves_are_rejected() {
+        let value = NotAllF32s::default();
+
+        let mut out = Vec::new();
+        let result = collect_f32_leaves(value.as_partial_reflect(), &mut out);
+
+        assert!(result.unwrap_err().to_string().contains("not an f32"));
+    }
+
+    #[test]
+    fn set_length_mismatch_fails_in_both_directions() {
+        with_transform_entity(|entity, component, type_registry| {
+            let too_few = [1.0f32; 9];
+            assert!(set_component_f32s(entity, component, &too_few, type_registry).is_err());
+
+            let too_many = [1.0f32; 11];
+            assert!(set_component_f32s(entity, component, &too_many, type_registry).is_err());
+
+            let exact = [1.0f32; 10];
+            set_component_f32s(entity, component, &exact, type_registry).unwrap();
+        });
+    }
+
+    #[test]
+    fn guest_components_have_no_f32_layout() {
+        let mut app = App::new();
+        app.register_type::<FakeTransform>();
+        let world = app.world_mut();
+        world.spawn(FakeTransform::default());
+
+        let host = ComponentRef::new(FakeTransform::type_path(), world).unwrap();
+        // An unregistered type path falls back to a guest component,
+        // leaving the type_id as None.
+        let guest = ComponentRef::new("my_mod::GuestComponent", world).unwrap();
+        let type_registry = world.resource::<AppTypeRegistry>().clone();
+
+        let mut query = QueryBuilder::<FilteredEntityMut>::new(world)
+            .mut_id(host.component_id())
+            .build();
+        let mut entity = query.single_mut(world).unwrap();
+
+        let result = set_component_f32s(&mut entity, &guest, &[1.0; 10], &type_registry);
+
+        assert!(result.unwrap_err().to_string().contains("guest component"));
+    }
+}
@@ -75,6 +75,56 @@ where
     entity_resource(entity, table)
 }
 
+/// Spawns one entity with `bundle` without creating a guest-visible resource.
+///
+/// Used by `commands.spawn-batch`, where handing back an `entity-commands`
+/// per entity would defeat the point of batching.
+pub(crate) fn spawn_bundle(host: &mut WasmHost, bundle: Bundle) -> Result<(), wasmtime::Error> {
+    let State::RunSystem {
+        commands,
+        type_registry,
+        codec,
+        insert_despawn_component,
+        access,
+        ..
+    } = host.access()
+    else {
+        return Err(wasmtime::Error::msg(
+            "Commands resource is only accessible when running systems",
+        ));
+    };
+
+    let mut entity_commands = commands.spawn_empty();
+
+    // Make sure the entity is not spawned outside the sandbox
+    // The mod can still override the ChildOf with its own value
+    if let ModAccess::Sandbox(entity) = access {
+        entity_commands.insert(ChildOf(*entity));
+    };
+
+    // Make sure this entity is despawned when the mod is despawned. See [ModDespawnBehaviour]
+    if let Some(mod_id) = insert_despawn_component.as_ref() {
+        entity_commands.insert(DespawnModEntity::new(*mod_id));
+    }
+
+    let entity = entity_commands.id();
+    trace!("Spawn ({entity}) from batch");
+    for (type_path, serialized_component) in bundle {
+        // TODO: collect instead of emitting immediately
+        insert_component(
+            commands,
+            type_registry,
+            codec,
+            entity,
+            type_path,
+            serialized_component,
+        )
+        .map_err(wasmtime::Error::msg)?;
+    }
+
+    Ok(())
+}
+
 pub(crate) fn insert<T>(
     host: &mut WasmHost,
     input: &Resource<T>,
@@ -2,7 +2,7 @@ use wasmtime::component::Resource;
 
 use crate::{
     bindings::wasvy::ecs::app::{Bundle, HostCommands},
-    entity::{insert, map_entity, spawn_empty},
+    entity::{insert, map_entity, spawn_bundle, spawn_empty},
     host::{WasmEntity, WasmEntityCommands, WasmHost},
 };
 
@@ -26,6 +26,18 @@ impl HostCommands for WasmHost {
         Ok(entity_commands)
     }
 
+    fn spawn_batch(
+        &mut self,
+        _: Resource<WasmCommands>,
+        bundles: Vec<Bundle>,
+    ) -> Result<(), wasmtime::Error> {
+        for bundle in bundles {
+            spawn_bundle(self, bundle)?;
+        }
+
+        Ok(())
+    }
+
     fn entity(
         &mut self,
         _: Resource<WasmCommands>,
@@ -94,6 +94,66 @@ impl HostComponent for WasmHost {
             .map_err(wasmtime::Error::msg)
     }
 
+    fn get_f32s(
+        &mut self,
+        component: Resource<WasmComponent>,
+    ) -> Result<Vec<f32>, wasmtime::Error> {
+        let State::RunSystem {
+            table,
+            queries,
+            query_resolver,
+            type_registry,
+            ..
+        } = self.access()
+        else {
+            return Err(wasmtime::Error::msg(
+                "Component can only be accessed in systems",
+            ));
+        };
+
+        let component = table.get(&component)?;
+        query_resolver
+            .get_f32s(
+                component.id,
+                component.entity,
+                component.index,
+                queries,
+                type_registry,
+            )
+            .map_err(wasmtime::Error::msg)
+    }
+
+    fn set_f32s(
+        &mut self,
+        component: Resource<WasmComponent>,
+        value: Vec<f32>,
+    ) -> Result<(), wasmtime::Error> {
+        let State::RunSystem {
+            table,
+            queries,
+            query_resolver,
+            type_registry,
+            ..
+        } = self.access()
+        else {
+            return Err(wasmtime::Error::msg(
+                "Component can only be accessed in systems",
+            ));
+        };
+
+        let component = table.get(&component)?;
+        query_resolver
+            .set_f32s(
+                component.id,
+                component.entity,
+                component.index,
+                &value,
+                queries,
+                type_registry,
+            )
+            .map_err(wasmtime::Error::msg)
+    }
+
     // Note: this is never guaranteed to be called by the wasi binary
     fn drop(&mut self, component: Resource<WasmComponent>) -> Result<(), wasmtime::Error> {
         let _ = self.table().delete(component)?;
@@ -2,7 +2,7 @@ use anyhow::{Result, bail};
 use wasmtime::component::Resource;
 
 use crate::{
-    bindings::wasvy::ecs::app::HostQuery,
+    bindings::wasvy::ecs::app::{ComponentIndex, HostQuery},
     host::{WasmHost, WasmQueryResult},
     query::{QueryCursor, QueryId},
     runner::State,
@@ -46,6 +46,66 @@ impl HostQuery for WasmHost {
         .map_err(|err| wasmtime::Error::msg(err.to_string()))
     }
 
+    fn count(&mut self, query: Resource<WasmQuery>) -> std::result::Result<u32, wasmtime::Error> {
+        (|| -> Result<_> {
+            let State::RunSystem { table, queries, .. } = self.access() else {
+                bail!("Query can only be accessed in systems")
+            };
+
+            let query = table.get(&query)?;
+            let query = queries.get_mut(query.id.index());
+            Ok(query.iter().count() as u32)
+        })()
+        .map_err(|err| wasmtime::Error::msg(err.to_string()))
+    }
+
+    fn get_column_f32s(
+        &mut self,
+        query: Resource<WasmQuery>,
+        index: ComponentIndex,
+    ) -> std::result::Result<Vec<f32>, wasmtime::Error> {
+        (|| -> Result<_> {
+            let State::RunSystem {
+                table,
+                queries,
+                query_resolver,
+                type_registry,
+                ..
+            } = self.access()
+            else {
+                bail!("Query can only be accessed in systems")
+            };
+
+            let query = table.get(&query)?;
+            query_resolver.get_column_f32s(query.id, index, queries, type_registry)
+        })()
+        .map_err(|err| wasmtime::Error::msg(err.to_string()))
+    }
+
+    fn set_column_f32s(
+        &mut self,
+        query: Resource<WasmQuery>,
+        index: ComponentIndex,
+        values: Vec<f32>,
+    ) -> std::result::Result<(), wasmtime::Error> {
+        (|| -> Result<()> {
+            let State::RunSystem {
+                table,
+                queries,
+                query_resolver,
+                type_registry,
+                ..
+            } = self.access()
+            else {
+                bail!("Query can only be accessed in systems")
+            };
+
+            let query = table.get(&query)?;
+            query_resolver.set_column_f32s(query.id, index, &values, queries, type_registry)
+        })()
+        .map_err(|err| wasmtime::Error::msg(err.to_string()))
+    }
+
     // Note: this is never guaranteed to be called by the wasi binary
     fn drop(&mut self, query: Resource<WasmQuery>) -> std::result::Result<(), wasmtime::Error> {
         (|| -> Result<()> {
@@ -4,7 +4,10 @@ use bevy_ecs::{
     world::FilteredEntityMut,
 };
 use wasvy_runtime::{
-    component::{ComponentRef, get_component, get_component_id_for_filter, set_component},
+    component::{
+        ComponentRef, apply_component_f32s, collect_component_f32s, get_component,
+        get_component_f32s, get_component_id_for_filter, set_component, set_component_f32s,
+    },
     serialize::CodecResource,
 };
 
@@ -82,6 +85,100 @@ impl QueryResolver {
         )
     }
 
+    pub(crate) fn get_f32s(
+        &self,
+        id: QueryId,
+        entity: Entity,
+        index: ComponentIndex,
+        queries: &mut Queries<'_, '_>,
+        type_registry: &AppTypeRegistry,
+    ) -> Result<Vec<f32>> {
+        let query_for = self.query_for(id, index)?;
+
+        let query = queries.get_mut(id.0);
+        let entity = query.get(entity)?;
+
+        get_component_f32s(&entity, &query_for.component, type_registry)
+    }
+
+    pub(crate) fn set_f32s(
+        &self,
+        id: QueryId,
+        entity: Entity,
+        index: ComponentIndex,
+        values: &[f32],
+        queries: &mut Queries<'_, '_>,
+        type_registry: &AppTypeRegistry,
+    ) -> Result<()> {
+        let query_for = self.query_for(id, index)?;
+        if !query_for.mutable {
+            bail!("Component is not mutable!")
+        }
+
+        let mut query = queries.get_mut(id.0);
+        let mut entity = query.get_mut(entity)?;
+
+        set_component_f32s(&mut entity, &query_for.component, values, type_registry)
+    }
+
+    pub(crate) fn get_column_f32s(
+        &self,
+        id: QueryId,
+        index: ComponentIndex,
+        queries: &mut Queries<'_, '_>,
+        type_registry: &AppTypeRegistry,
+    ) -> Result<Vec<f32>> {
+        let query_for = self.query_for(id, index)?;
+
+        let query = queries.get_mut(id.0);
+        let mut values = Vec::new();
+        let mut entities = query.iter();
+        let Some(entity) = entities.next() else {
+            return Ok(values);
+        };
+        collect_component_f32s(&entity, &query_for.component, type_registry, &mut values)?;
+
+        // Every entity shares the component layout, so the first one tells us
+        // the column stride. Reserve the rest of the column up front instead
+        // of growing it through repeated reallocation.
+        values.reserve(values.len() * entities.size_hint().0);
+        for entity in entities {
+            collect_component_f32s(&entity, &query_for.component, type_registry, &mut values)?;
+        }
+
+        Ok(values)
+    }
+
+    pub(crate) fn set_column_f32s(
+        &self,
+        id: QueryId,
+        index: ComponentIndex,
+        values: &[f32],
+        queries: &mut Queries<'_, '_>,
+        type_registry: &AppTypeRegistry,
+    ) -> Result<()> {
+        let query_for = self.query_for(id, index)?;
+        if !query_for.mutable {
+            bail!("Component is not mutable!")
+        }
+
+        let mut query = queries.get_mut(id.0);
+        let mut values = values.iter();
+        for mut entity in query.iter_mut() {
+            apply_component_f32s(
+                &mut entity,
+                &query_for.component,
+                &mut values,
+                type_registry,
+            )?;
+        }
+        if values.next().is_some() {
+            bail!("Column is longer than the query results")
+        }
+
+        Ok(())
+    }
+
     pub(crate) fn query_for(
         &self,
         id: QueryId,
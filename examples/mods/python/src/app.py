@@ -1,15 +1,19 @@
-import json
-import msgpack
-import math
+import numpy as np
+from math import cos, sin
 from typing import List
 from dataclasses import dataclass, asdict
 
 import wit_world
 from wit_world.imports.app import App, Commands, Query, QueryFor_Mut, QueryFor_With, Schedule_Update, System
 
-import wasvy_codec
 from wasvy_codec import get_codec
 
+# Registered on the host as "python::MyComponent". Defined at module level so
+# my_system doesn't rebuild the class (and its dataclass machinery) per run.
+@dataclass(frozen=True, slots=True)
+class MyComponent:
+    value: int
+
 class WitWorld(wit_world.WitWorld):
     def setup(self, app: App):
         spin_cube = System("spin-cube")
@@ -29,79 +33,99 @@ class WitWorld(wit_world.WitWorld):
     # Spin speed
     DELTA = 0.015
 
-    def spin_cube(self, query: Query):
-        codec = get_codec()
-
-        """Advance rotation about the x-axis for the single component returned per iter()."""
-        while True:
-            query_result = query.iter()
-            if query_result is None:
-                break
-
-            component = query_result.component(0)
-
-            transform = codec.loads(component.get())
-
-            rotation = transform["rotation"]
-            q = q_normalize([float(rotation[0]), float(rotation[1]), float(rotation[2]), float(rotation[3])])
+    # Half-angle terms of the constant step quaternion dq = (COS_H, SIN_H, 0, 0).
+    # DELTA never changes, so these are computed once at import time rather
+    # than once per system run.
+    COS_H = cos(0.5 * DELTA)
+    SIN_H = sin(0.5 * DELTA)
 
-            # Use the current quaternion (the "previous x rotation") and advance about X:
-            dq = q_from_xaxis(self.DELTA)
-            q_next = q_normalize(q_mul(q, dq))
+    def spin_cube(self, query: Query):
+        """Advance rotation about the x-axis for every transform matched by the query."""
+        ch = self.COS_H
+        sh = self.SIN_H
+
+        # One host call fetches the Transform column for every matching
+        # entity and one writes it back, instead of an iter() + get() + set()
+        # boundary crossing per entity. Each transform is 10 f32 leaves:
+        # translation (0:3), rotation (3:7, xyzw) and scale (7:10).
+        column = query.get_column_f32s(0)
+        if not column:
+            return
 
-            transform["rotation"] = q_next
-            component.set(codec.dumps(transform))
+        # Update every rotation at once: numpy dispatches the element-wise
+        # math to native SIMD loops instead of running the quaternion update
+        # per entity in the interpreter. ch/sh broadcast as scalars.
+        # Note: there is no JIT tier available here — numba and friends need
+        # LLVM at runtime, which cannot run inside a componentize-py guest —
+        # so precompiled numpy kernels are as native as this path gets.
+        transforms = np.asarray(column, dtype=np.float32).reshape(-1, 10)
+        x, y, z, w = transforms[:, 3:7].T
+
+        # q ⊗ dq written out for dq = (ch, sh, 0, 0): the zero terms of
+        # the generic quaternion product cancel, leaving 8 muls + 4 adds.
+        nw = w * ch - x * sh
+        nx = w * sh + x * ch
+        ny = y * ch + z * sh
+        nz = z * ch - y * sh
+
+        # Renormalize to keep float drift from accumulating. Most frames the
+        # whole column is still unit-norm within tolerance (drift needs a few
+        # updates to reach 1e-6), so one cheap reduction decides whether the
+        # correction passes run at all. When they do run, use the exact
+        # normalize: another writer may have put an arbitrary rotation on a
+        # matched entity, and an approximate rsqrt seeded for near-unit input
+        # diverges on such values. The sqrt only costs on the occasional
+        # correction frame. The floor keeps a zero-norm rotation from
+        # dividing by zero (its lanes just stay zero).
+        n2 = nw * nw + nx * nx + ny * ny + nz * nz
+        if np.abs(n2 - 1.0).max() > 1e-6:
+            inv = 1.0 / np.sqrt(np.maximum(n2, np.float32(1e-30)))
+            nx *= inv
+            ny *= inv
+            nz *= inv
+            nw *= inv
+
+        # Write the lanes back in place rather than stacking a fresh (N, 4)
+        # array just to assign it into the column.
+        transforms[:, 3] = nx
+        transforms[:, 4] = ny
+        transforms[:, 5] = nz
+        transforms[:, 6] = nw
+
+        query.set_column_f32s(0, transforms.ravel().tolist())
 
     def my_system(self, commands: Commands, query: Query):
-        codec = get_codec()
-
-        # Count how many entities we've spawned
-        count = 0
-        while True:
-            components = query.iter()
-            if components is None:
-                break
-            count += 1
-
-        # Avoid spawning more than 10
-        if count >= 10:
+        # Avoid spawning more than 10. count() is a single host call instead
+        # of an iter() round-trip per already-spawned entity.
+        missing = 10 - query.count()
+        if missing <= 0:
             return
 
-        @dataclass
-        class MyComponent:
-            value: int
+        print(f"Spawning {missing} entities with MyComponent component in my-system")
 
-        print("Spawning an entity with MyComponent component in my-system")
+        # All the missing entities go through one spawn-batch host call
+        # instead of one spawn (and one entity-commands resource) apiece.
+        commands.spawn_batch([_default_bundle()] * missing)
 
-        component_1 = asdict(MyComponent(value=0))
+_DEFAULT_BUNDLE: List | None = None
 
-        # Default transform
-        component_2 = {
-            "translation": [0.0, 0.0, 0.0],
-            "rotation":    [1.0, 0.0, 0.0, 0.0],
-            "scale":       [1.0, 1.0, 1.0],
-        }
+def _default_bundle() -> List:
+    """The bundle my_system spawns is identical every time, so encode it once.
 
-        commands.spawn([
-            ("python::MyComponent", codec.dumps(component_1)),
-            ("bevy_transform::components::transform::Transform", codec.dumps(component_2)),
-        ])
+    Encoding has to wait until the host has negotiated a codec, hence the
+    lazy cache rather than a module-level constant (same as get_codec).
+    """
+    global _DEFAULT_BUNDLE
+    if _DEFAULT_BUNDLE is None:
+        codec = get_codec()
+        _DEFAULT_BUNDLE = [
+            ("python::MyComponent", codec.dumps(asdict(MyComponent(value=0)))),
+            # Default transform
+            ("bevy_transform::components::transform::Transform", codec.dumps({
+                "translation": [0.0, 0.0, 0.0],
+                "rotation":    [1.0, 0.0, 0.0, 0.0],
+                "scale":       [1.0, 1.0, 1.0],
+            })),
+        ]
+    return _DEFAULT_BUNDLE
 
-def q_normalize(q: List[float]) -> List[float]:
-    w, x, y, z = q
-    n = math.sqrt(w*w + x*x + y*y + z*z)
-    return [1.0, 0.0, 0.0, 0.0] if n == 0 else [w/n, x/n, y/n, z/n]
-
-def q_mul(a: List[float], b: List[float]) -> List[float]:
-    aw, ax, ay, az = a
-    bw, bx, by, bz = b
-    return [
-        aw*bw - ax*bx - ay*by - az*bz,
-        aw*bx + ax*bw + ay*bz - az*by,
-        aw*by - ax*bz + ay*bw + az*bx,
-        aw*bz + ax*by - ay*bx + az*bw,
-    ]
-
-def q_from_xaxis(delta_rad: float) -> List[float]:
-    h = 0.5 * delta_rad
-    return [math.cos(h), math.sin(h), 0.0, 0.0]
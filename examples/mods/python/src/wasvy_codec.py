@@ -1,36 +1,53 @@
-from enum import Enum
+from enum import IntEnum, auto
 import json
 
 import msgpack
 from wit_world.imports.app import Serialize
 
-class SerializeType(Enum):
-    JSON = "json"
-    MSGPACK = "msgpack"
-    UNKOWN = "unknown"
+# orjson is a C implementation of JSON with SIMD-accelerated number parsing.
+# It is optional: componentize-py guests without a wheel fall back to stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The wire names ("json"/"msgpack") only exist during negotiation, so the
+# members are plain ints: comparisons are identity checks and the instances
+# carry no string payload.
+class SerializeType(IntEnum):
+    JSON = auto()
+    MSGPACK = auto()
+    UNKOWN = auto()
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 class WasvyCodec():
+    # No per-instance __dict__; the codec is a long-lived singleton but its
+    # attribute set is fixed and slot lookups are cheaper on the hot path.
+    __slots__ = ("serialize_type", "loads", "dumps")
+
     def __init__(self):
         serialize_type = Serialize().get_type()
         if serialize_type == "json":
             self.serialize_type = SerializeType.JSON
+            # Bind the codec functions once so the per-component hot path
+            # doesn't branch on the serialize type for every call.
+            if orjson is not None:
+                self.loads = orjson.loads
+                self.dumps = orjson.dumps
+            else:
+                self.loads = json.loads
+                self.dumps = _json_dumps
         elif serialize_type == "msgpack":
             self.serialize_type = SerializeType.MSGPACK
+            self.loads = msgpack.loads
+            # A Packer is configured once and reused; msgpack.dumps would
+            # construct a fresh one for every component.
+            self.dumps = msgpack.Packer(use_bin_type=True).pack
         else:
             raise ValueError(f"Unsupported serialize type: {serialize_type}")
 
-    def loads(self, data):
-        if self.serialize_type == SerializeType.JSON:
-            return json.loads(data)
-        elif self.serialize_type == SerializeType.MSGPACK:
-            return msgpack.loads(data)
-        
-    def dumps(self, obj):
-        if self.serialize_type == SerializeType.JSON:
-            return json.dumps(obj).encode('utf-8')
-        elif self.serialize_type == SerializeType.MSGPACK:
-            return msgpack.dumps(obj, use_bin_type=True)
-        
 
 _codec_instance: WasvyCodec | None = None
 
@@ -39,4 +56,4 @@ def get_codec() -> WasvyCodec:
     global _codec_instance
     if _codec_instance is None:
         _codec_instance = WasvyCodec()
-    return _codec_instance
\ No newline at end of file
+    return _codec_instance
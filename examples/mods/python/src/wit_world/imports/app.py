@@ -255,6 +255,14 @@ class Commands:
         and returns the entity's corresponding `entity-commands`.
         """
         raise NotImplementedError
+    def spawn_batch(self, bundles: List[List[Tuple[str, bytes]]]) -> None:
+        """
+        Spawns one new `entity` per bundle in the batch.
+        
+        Unlike `spawn` this does not hand back `entity-commands`, so any
+        number of spawns costs a single host call.
+        """
+        raise NotImplementedError
     def entity(self, entity: Entity) -> EntityCommands:
         """
         Returns the `entity-commands` for the given `entity`.
@@ -285,6 +293,28 @@ class Component:
         """
         Sets the value of a component
         
+        Traps if this component was not declared as mutable
+        """
+        raise NotImplementedError
+    def get_f32s(self) -> List[float]:
+        """
+        Gets the component as its raw f32 leaves, in field declaration order.
+        
+        This skips the negotiated codec entirely, so there is no text
+        formatting or parsing on the hot path. Only host types registered
+        for reflection whose leaves are all f32 (for example
+        `bevy_transform::components::transform::Transform`) support this;
+        other components must keep using `get`.
+        """
+        raise NotImplementedError
+    def set_f32s(self, value: List[float]) -> None:
+        """
+        Sets the component from its raw f32 leaves, in field declaration order.
+        
+        The list must contain exactly as many values as `get-f32s` returns.
+        A write that leaves every leaf unchanged is skipped, so it does not
+        trigger the host's change detection.
+        
         Traps if this component was not declared as mutable
         """
         raise NotImplementedError
@@ -354,6 +384,38 @@ class Query:
         Evaluates and returns the next query results
         """
         raise NotImplementedError
+    def count(self) -> int:
+        """
+        Returns the number of entities matched by the query.
+        
+        One host call, so counting results no longer needs an `iter`
+        round-trip per entity.
+        """
+        raise NotImplementedError
+    def get_column_f32s(self, index: int) -> List[float]:
+        """
+        Gets component `index` for every entity matched by the query as one
+        contiguous column of raw f32 leaves, in query iteration order.
+        
+        One host call replaces an `iter` + `component.get` round-trip per
+        entity. The layout restrictions of `component.get-f32s` apply.
+        """
+        raise NotImplementedError
+    def set_column_f32s(self, index: int, values: List[float]) -> None:
+        """
+        Writes a column in the shape returned by `get-column-f32s` back to
+        every entity matched by the query, in query iteration order.
+        
+        Query iteration order is stable within a system run (structural
+        changes are deferred), so a column read at the start of the system
+        can be written back at the end.
+        
+        Entities whose leaves are all unchanged are skipped, so writing an
+        untouched column back does not trigger the host's change detection.
+        
+        Traps if the component was not declared as mutable
+        """
+        raise NotImplementedError
     def __enter__(self) -> Self:
         """Returns self"""
         return self